@@ -1,6 +1,7 @@
 from flask import Flask, render_template, request, redirect, url_for, flash
 from flask_migrate import Migrate
-from models import db, Jugador, Partido, Calificacion
+from models import (db, Jugador, Partido, Calificacion, inscripciones,
+                    subconsulta_inscritos, plantel_partido)
 from logica import actualizar_estadisticas_jugador, crear_equipos_balanceados
 from datetime import datetime
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
@@ -44,13 +45,13 @@ def inicio():
     # Obtener la fecha de hoy para no mostrar partidos de ayer
     hoy = datetime.utcnow().date()
     
-    # Obtener los partidos que no están llenos y cuya fecha es hoy o en el futuro
-    partidos_disponibles = []
-    todos_los_partidos = Partido.query.order_by(Partido.fecha.asc()).all()
-    
-    for partido in todos_los_partidos:
-        if len(partido.jugadores_inscritos) < partido.jugadores_necesarios and partido.fecha.date() >= hoy:
-            partidos_disponibles.append(partido)
+    # Obtener los partidos que no están llenos y cuya fecha es hoy o en el futuro,
+    # junto con la cantidad de inscritos (sin cargar la lista de jugadores)
+    inscritos = subconsulta_inscritos()
+    partidos_disponibles = db.session.query(Partido, inscritos).filter(
+        Partido.fecha >= datetime.combine(hoy, datetime.min.time()),
+        inscritos < Partido.jugadores_necesarios
+    ).order_by(Partido.fecha.asc()).all()
 
     return render_template('inicio.html', partidos=partidos_disponibles)
 
@@ -131,9 +132,12 @@ def crear_partido():
 @app.route('/partido/<int:partido_id>')
 def detalle_partido(partido_id):
     partido = Partido.query.get_or_404(partido_id)
+    plantel = plantel_partido(partido.id)
     # Comprobar si la fecha del partido ya pasó
     partido_pasado = partido.fecha < datetime.utcnow()
-    return render_template('detalle_partido.html', partido=partido, partido_pasado=partido_pasado)
+    inscrito = current_user.is_authenticated and any(j.id == current_user.id for j in plantel)
+    return render_template('detalle_partido.html', partido=partido, plantel=plantel,
+                           inscrito=inscrito, partido_pasado=partido_pasado)
 
 @app.route('/partido/<int:partido_id>/inscribir', methods=['POST'])
 @login_required # <-- PROTEGER RUTA
@@ -142,9 +146,18 @@ def inscribir_jugador(partido_id):
     
     # Usar 'current_user' que viene de Flask-Login
     jugador = current_user 
+
+    # Solo hacen falta la cantidad de inscritos y si el jugador ya figura entre ellos
+    cantidad_inscritos = db.session.query(db.func.count()).select_from(inscripciones).filter(
+        inscripciones.c.partido_id == partido.id
+    ).scalar()
+    ya_inscrito = db.session.query(db.exists().where(
+        inscripciones.c.jugador_id == jugador.id,
+        inscripciones.c.partido_id == partido.id
+    )).scalar()
     
-    if jugador and jugador not in partido.jugadores_inscritos and len(partido.jugadores_inscritos) < partido.jugadores_necesarios:
-        partido.jugadores_inscritos.append(jugador)
+    if jugador and not ya_inscrito and cantidad_inscritos < partido.jugadores_necesarios:
+        db.session.execute(inscripciones.insert().values(jugador_id=jugador.id, partido_id=partido.id))
         db.session.commit()
         flash('¡Te has inscrito al partido con éxito!', 'success')
     else:
@@ -159,8 +172,12 @@ def darse_de_baja(partido_id):
     
     # Solo se puede dar de baja si el partido no ha ocurrido
     if partido.fecha > datetime.utcnow():
-        if current_user in partido.jugadores_inscritos:
-            partido.jugadores_inscritos.remove(current_user)
+        # Borrar la inscripción directamente, sin cargar la lista de inscritos
+        baja = db.session.execute(inscripciones.delete().where(
+            inscripciones.c.jugador_id == current_user.id,
+            inscripciones.c.partido_id == partido.id
+        ))
+        if baja.rowcount:
             db.session.commit()
             flash('Te has dado de baja del partido con éxito.', 'success')
         else:
@@ -176,9 +193,10 @@ def organizar_partido(partido_id):
     equipos = None
 
     if request.method == 'POST':
-        # La lógica de balanceo ya usa los jugadores del partido
-        if partido.jugadores_inscritos:
-            equipos = crear_equipos_balanceados(partido.jugadores_inscritos)
+        # La lógica de balanceo solo necesita el puntaje global de cada inscrito
+        plantel = plantel_partido(partido.id)
+        if plantel:
+            equipos = crear_equipos_balanceados(plantel)
 
     return render_template('organizar_partido.html', partido=partido, equipos=equipos)
 
@@ -186,17 +204,22 @@ def organizar_partido(partido_id):
 @login_required
 def calificar_partido(partido_id):
     partido = Partido.query.get_or_404(partido_id)
+    plantel = plantel_partido(partido.id)
 
     # Asegurarse de que el usuario actual jugó en el partido
-    if current_user not in partido.jugadores_inscritos:
+    if not any(j.id == current_user.id for j in plantel):
         flash("No puedes calificar en un partido en el que no jugaste.", "warning")
         return redirect(url_for('detalle_partido', partido_id=partido.id))
 
     # Obtener los IDs de los jugadores que el usuario actual ya calificó en este partido
-    calificados_ids = [c.calificado_id for c in Calificacion.query.filter_by(calificador_id=current_user.id, partido_id=partido.id).all()]
+    calificados = db.session.query(Calificacion.calificado_id).filter_by(
+        calificador_id=current_user.id,
+        partido_id=partido.id
+    ).all()
+    calificados_ids = {c.calificado_id for c in calificados}
     
     # Lista de jugadores del partido, excluyendo al usuario actual
-    companeros = [j for j in partido.jugadores_inscritos if j.id != current_user.id]
+    companeros = [j for j in plantel if j.id != current_user.id]
 
     # Separar entre los que faltan por calificar y los ya calificados
     jugadores_a_calificar = [j for j in companeros if j.id not in calificados_ids]
@@ -293,27 +316,33 @@ def logout():
 def partidos_anteriores():
     now = datetime.utcnow()
     
-    partidos_jugados = sorted(
-        [partido for partido in current_user.partidos_inscritos if partido.fecha < now],
-        key=lambda p: p.fecha,
-        reverse=True
-    )
+    # Contar a cuántos compañeros ya ha calificado el usuario en cada partido
+    calificaciones_hechas = db.select(db.func.count(Calificacion.id)).where(
+        Calificacion.calificador_id == current_user.id,
+        Calificacion.partido_id == Partido.id
+    ).correlate(Partido).scalar_subquery()
+    
+    # Una sola consulta trae los partidos jugados con sus conteos
+    filas = db.session.query(Partido, subconsulta_inscritos(), calificaciones_hechas).join(
+        inscripciones, inscripciones.c.partido_id == Partido.id
+    ).filter(
+        inscripciones.c.jugador_id == current_user.id,
+        Partido.fecha < now
+    ).order_by(Partido.fecha.desc()).all()
     
     # Vamos a crear un diccionario para pasar datos adicionales a la plantilla
+    partidos_jugados = []
     info_partidos = {}
-    for partido in partidos_jugados:
-        # Contar a cuántos compañeros ya ha calificado el usuario en este partido
-        calificaciones_hechas = Calificacion.query.filter_by(
-            calificador_id=current_user.id, 
-            partido_id=partido.id
-        ).count()
+    for partido, participantes, hechas in filas:
+        partidos_jugados.append(partido)
         
         # Contar cuántos compañeros había en total (todos los inscritos menos uno mismo)
-        total_companeros = len(partido.jugadores_inscritos) - 1
+        total_companeros = participantes - 1
         
         # Guardar si la calificación está completa o no
         info_partidos[partido.id] = {
-            'calificacion_completa': calificaciones_hechas >= total_companeros
+            'participantes': participantes,
+            'calificacion_completa': hechas >= total_companeros
         }
     
     return render_template('partidos_anteriores.html', 
@@ -33,7 +33,8 @@ def crear_equipos_balanceados(jugadores_seleccionados):
     """
     Divide una lista de jugadores en dos equipos balanceados por puntaje global.
 
-    :param jugadores_seleccionados: Una lista de objetos Jugador.
+    :param jugadores_seleccionados: Una lista de objetos con 'puntaje_global', como las
+                                    filas de plantel_partido() o instancias de Jugador.
     :return: Un diccionario con 'equipo_a' y 'equipo_b'.
     """
     # Ordenar jugadores de mayor a menor puntaje global
@@ -60,7 +60,8 @@ class Calificacion(db.Model):
     __table_args__ = (db.UniqueConstraint('calificador_id', 'calificado_id', 'partido_id', name='_calificacion_uc'),)
 
     def __repr__(self):
-        return f'<Calificacion de {self.calificador.nombre} a {self.calificado.nombre} en partido {self.partido_id}>'
+        # Solo usa columnas propias para no disparar cargas de relaciones al imprimir
+        return f'<Calificacion de {self.calificador_id} a {self.calificado_id} en partido {self.partido_id}>'
     
 class Partido(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -69,8 +70,37 @@ class Partido(db.Model):
     fecha = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     jugadores_necesarios = db.Column(db.Integer, nullable=False)
 
+    # La lista de inscritos no se carga junto con el partido: cada consulta que la
+    # necesite completa debe pedirla (p. ej. con db.selectinload). Para contar o
+    # mostrar nombres conviene usar subconsulta_inscritos() o plantel_partido().
     jugadores_inscritos = db.relationship('Jugador', secondary=inscripciones,
-                                          lazy='subquery', backref=db.backref('partidos_inscritos', lazy=True))
+                                          lazy='select', backref=db.backref('partidos_inscritos', lazy=True))
 
     def __repr__(self):
-        return f'<Partido en {self.nombre_cancha} ({self.ubicacion}) el {self.fecha}>'
\ No newline at end of file
+        return f'<Partido en {self.nombre_cancha} ({self.ubicacion}) el {self.fecha}>'
+
+def subconsulta_inscritos():
+    """
+    Subconsulta correlacionada con la cantidad de jugadores inscritos a cada partido.
+
+    :return: Una expresión escalar para usar como columna o filtro en consultas sobre Partido.
+    """
+    return (db.select(db.func.count())
+            .select_from(inscripciones)
+            .where(inscripciones.c.partido_id == Partido.id)
+            .correlate(Partido)
+            .scalar_subquery())
+
+def plantel_partido(partido_id):
+    """
+    Obtiene una proyección liviana de los jugadores inscritos a un partido,
+    sin cargar las entidades Jugador completas.
+
+    :param partido_id: El id del partido.
+    :return: Una lista de filas con 'id', 'nombre', 'apellido' y 'puntaje_global'.
+    """
+    return (db.session.query(Jugador.id, Jugador.nombre, Jugador.apellido, Jugador.puntaje_global)
+            .join(inscripciones, inscripciones.c.jugador_id == Jugador.id)
+            .filter(inscripciones.c.partido_id == partido_id)
+            .order_by(Jugador.id)
+            .all())
@@ -0,0 +1,122 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+# La aplicación lee DATABASE_URL al importarse: usar una base SQLite en memoria
+os.environ['DATABASE_URL'] = 'sqlite://'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as modulo_app
+from app import app
+from models import db, Jugador, Partido, Calificacion
+
+TAMANIOS_PLANTEL = [2, 9]
+
+# Columnas que nunca deberían leerse para mostrar un plantel
+COLUMNAS_PESADAS = [
+    'jugador.password_hash',
+    'jugador.puntaje_ataque',
+    'jugador.puntaje_defensa',
+    'jugador.puntaje_fisico',
+    'jugador.puntaje_pases',
+    'jugador.puntaje_vision',
+]
+
+
+def crear_jugador(numero):
+    jugador = Jugador(nombre=f'Jugador{numero}', apellido='Prueba', email=f'jugador{numero}@prueba.com')
+    jugador.set_password('clave')
+    db.session.add(jugador)
+    return jugador
+
+
+def sembrar(tamanio_plantel):
+    """
+    Crea al usuario de prueba y tres partidos cuyos planteles tienen el tamaño indicado:
+    uno futuro sin el usuario, uno futuro con el usuario y uno pasado con el usuario.
+    """
+    usuario = crear_jugador(0)
+    otros = [crear_jugador(i) for i in range(1, tamanio_plantel + 1)]
+    necesarios = tamanio_plantel + 5
+    manana = datetime.utcnow() + timedelta(days=1)
+    ayer = datetime.utcnow() - timedelta(days=1)
+
+    ajeno = Partido(nombre_cancha='Ajeno', ubicacion='Cancha 1', fecha=manana, jugadores_necesarios=necesarios)
+    propio = Partido(nombre_cancha='Propio', ubicacion='Cancha 2', fecha=manana, jugadores_necesarios=necesarios)
+    jugado = Partido(nombre_cancha='Jugado', ubicacion='Cancha 3', fecha=ayer, jugadores_necesarios=necesarios)
+    ajeno.jugadores_inscritos.extend(otros)
+    propio.jugadores_inscritos.extend([usuario] + otros[1:])
+    jugado.jugadores_inscritos.extend([usuario] + otros)
+    db.session.add_all([ajeno, propio, jugado])
+    db.session.commit()
+
+    db.session.add(Calificacion(calificador_id=usuario.id, calificado_id=otros[0].id, partido_id=jugado.id,
+                                ataque=5, defensa=5, fisico=5, pases=5, vision=5))
+    db.session.commit()
+    return {'ajeno': ajeno.id, 'propio': propio.id, 'jugado': jugado.id}
+
+
+@pytest.fixture
+def cliente():
+    app.config['TESTING'] = True
+    with app.app_context():
+        db.create_all()
+    yield app.test_client()
+    with app.app_context():
+        db.drop_all()
+
+
+def ejecutar_contando(cliente, motor, metodo, url):
+    """Ejecuta una petición y devuelve las sentencias SQL que se emitieron durante ella."""
+    sentencias = []
+
+    def registrar(conn, cursor, sentencia, parametros, contexto, executemany):
+        sentencias.append(sentencia)
+
+    event.listen(motor, 'before_cursor_execute', registrar)
+    try:
+        respuesta = getattr(cliente, metodo)(url)
+    finally:
+        event.remove(motor, 'before_cursor_execute', registrar)
+    assert respuesta.status_code in (200, 302)
+    return sentencias
+
+
+# (ruta, método, partido usado, cantidad de consultas esperada)
+RUTAS = [
+    ('inicio', 'get', None, 2),
+    ('detalle_partido', 'get', 'propio', 3),
+    ('inscribir_jugador', 'post', 'ajeno', 6),
+    ('darse_de_baja', 'post', 'propio', 4),
+    ('organizar_partido', 'post', 'propio', 2),
+    ('calificar_partido', 'get', 'jugado', 4),
+    ('partidos_anteriores', 'get', None, 2),
+]
+
+
+@pytest.mark.parametrize('ruta, metodo, partido, consultas_esperadas', RUTAS)
+@pytest.mark.parametrize('tamanio_plantel', TAMANIOS_PLANTEL)
+def test_consultas_por_ruta(cliente, monkeypatch, ruta, metodo, partido, consultas_esperadas, tamanio_plantel):
+    with app.app_context():
+        partidos = sembrar(tamanio_plantel)
+        motor = db.engine
+    cliente.post('/login', data={'email': 'jugador0@prueba.com', 'password': 'clave'})
+
+    if ruta == 'organizar_partido':
+        # Su plantilla no existe en el repositorio; solo interesan las consultas de la vista
+        monkeypatch.setattr(modulo_app, 'render_template', lambda *args, **kwargs: '')
+
+    with app.test_request_context():
+        url = modulo_app.url_for(ruta, partido_id=partidos[partido]) if partido else modulo_app.url_for(ruta)
+    sentencias = ejecutar_contando(cliente, motor, metodo, url)
+
+    # La cantidad de consultas no depende del tamaño del plantel
+    assert len(sentencias) == consultas_esperadas, sentencias
+
+    # A lo sumo se carga completo el usuario actual; los planteles son proyecciones
+    cargas_completas = [s for s in sentencias if any(c in s for c in COLUMNAS_PESADAS)]
+    assert len(cargas_completas) <= 1
+    assert all('inscripciones' not in s for s in cargas_completas)